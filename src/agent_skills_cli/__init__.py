@@ -1,6 +1,12 @@
-from .config import default_config, init_config, load_config, save_config
-from .errors import ConfigError
-from .schema import AgentConfig, RepoConfig, RootConfig, SkillConfig
+from __future__ import annotations
+
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .config import default_config, init_config, load_config, save_config
+    from .errors import ConfigError
+    from .schema import AgentConfig, RepoConfig, RootConfig, SkillConfig
 
 __all__ = [
     "AgentConfig",
@@ -13,3 +19,28 @@ __all__ = [
     "load_config",
     "save_config",
 ]
+
+_EXPORTS = {
+    "AgentConfig": "schema",
+    "ConfigError": "errors",
+    "RepoConfig": "schema",
+    "RootConfig": "schema",
+    "SkillConfig": "schema",
+    "default_config": "config",
+    "init_config": "config",
+    "load_config": "config",
+    "save_config": "config",
+}
+
+
+def __getattr__(name: str) -> object:
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(__all__)
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import logging
-import tempfile
+import os
 from pathlib import Path
 from typing import Any, NoReturn, cast
 
@@ -41,15 +41,7 @@ def _save_validated(path: Path, data: dict) -> RootConfig:
 def _write_temp_config(config_path: Path, data: dict) -> Path:
     config = RootConfig.from_dict(data)
     config_path.parent.mkdir(parents=True, exist_ok=True)
-    with tempfile.NamedTemporaryFile(
-        mode="w",
-        encoding="utf-8",
-        delete=False,
-        dir=config_path.parent,
-        prefix=f"{config_path.name}.",
-        suffix=".tmp",
-    ) as handle:
-        temp_path = Path(handle.name)
+    temp_path = config_path.with_name(f"{config_path.name}.{os.getpid()}.tmp")
     save_config(temp_path, config)
     return temp_path
 
@@ -63,11 +55,10 @@ def _ensure_repo_list(data: dict[str, Any]) -> list[RepoEntry]:
     if repos_value is None:
         repos_value = []
         data["repos"] = repos_value
-    if not isinstance(repos_value, list):
+    if type(repos_value) is not list:
         _fail("repos must be a list")
-    for item in repos_value:
-        if not isinstance(item, dict):
-            _fail("repo entries must be mappings")
+    if not all(type(item) is dict for item in repos_value):
+        _fail("repo entries must be mappings")
     return cast("list[RepoEntry]", repos_value)
 
 
@@ -76,11 +67,10 @@ def _ensure_skill_list(repo: RepoEntry) -> list[SkillEntry]:
     if skills_value is None:
         skills_value = []
         repo["skills"] = skills_value
-    if not isinstance(skills_value, list):
+    if type(skills_value) is not list:
         _fail("skills must be a list")
-    for item in skills_value:
-        if not isinstance(item, dict):
-            _fail("skill entries must be mappings")
+    if not all(type(item) is dict for item in skills_value):
+        _fail("skill entries must be mappings")
     return cast("list[SkillEntry]", skills_value)
 
 
@@ -256,35 +246,8 @@ def enable(
     except ConfigError as exc:
         _fail(str(exc))
 
-    data: dict[str, Any] = cfg.to_dict()
-    repos = _ensure_repo_list(data)
-    skill_entry = None
-    for repo in repos:
-        for entry in _ensure_skill_list(repo):
-            if entry.get("name") == skill:
-                skill_entry = entry
-                break
-        if skill_entry:
-            break
-
-    if skill_entry is None:
-        _fail(f"Skill not found: {skill}")
-
-    entry = cast("SkillEntry", skill_entry)
-    agents_value = entry.get("agents")
-    if agents_value is None:
-        agents_value = []
-        entry["agents"] = agents_value
-    if not isinstance(agents_value, list):
-        _fail("Skill agents must be a list")
-
-    agents = cast("list[str]", agents_value)
-    for name in agent:
-        if name not in agents:
-            agents.append(name)
-
     try:
-        _save_validated(config_path, data)
+        save_config(config_path, cfg.with_skill_enabled(skill, agent))
     except ConfigError as exc:
         _fail(str(exc))
     typer.echo(f"Enabled {skill} for {', '.join(agent)}")
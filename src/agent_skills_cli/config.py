@@ -1,13 +1,21 @@
 from __future__ import annotations
 
+from functools import cache
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 from .errors import ConfigError
 from .schema import AgentConfig, RootConfig
 
+if TYPE_CHECKING:
+    from types import ModuleType
+
 PathLike = Path | str
 
+_PARSED_CACHE: dict[Path, tuple[int, int, RootConfig]] = {}
+
 
+@cache
 def default_config() -> RootConfig:
     return RootConfig(
         version=1,
@@ -31,8 +39,17 @@ def init_config(path: PathLike, *, overwrite: bool = False) -> RootConfig:
 
 
 def load_config(path: PathLike) -> RootConfig:
-    raw = load_config_data(path)
-    return RootConfig.from_dict(raw)
+    target = Path(path)
+    stamp = _stat_stamp(target)
+    if stamp is not None:
+        cached = _PARSED_CACHE.get(target)
+        if cached is not None and cached[:2] == stamp:
+            return cached[2]
+    raw = load_config_data(target)
+    config = RootConfig.from_dict(raw)
+    if stamp is not None:
+        _PARSED_CACHE[target] = (*stamp, config)
+    return config
 
 
 def load_config_data(path: PathLike) -> dict:
@@ -45,26 +62,55 @@ def load_config_data(path: PathLike) -> dict:
 
 
 def save_config(path: PathLike, config: RootConfig) -> None:
-    _dump_yaml(Path(path), config.to_dict())
+    target = Path(path)
+    _dump_yaml(target, config.to_dict())
+    stamp = _stat_stamp(target)
+    if stamp is None:
+        _PARSED_CACHE.pop(target, None)
+    else:
+        _PARSED_CACHE[target] = (*stamp, config)
 
 
-def _load_yaml(path: Path) -> object:
+def _stat_stamp(path: Path) -> tuple[int, int] | None:
     try:
-        import yaml
-    except ImportError as exc:
-        raise ConfigError("PyYAML is required to load config files") from exc
+        stat = path.stat()
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+_YAML: tuple[ModuleType, type, type] | None = None
+
+
+def _import_yaml() -> tuple[ModuleType, type, type]:
+    """Import PyYAML once and resolve the fastest available loader/dumper."""
+    global _YAML  # noqa: PLW0603
+    if _YAML is None:
+        try:
+            import yaml
+        except ImportError as exc:
+            raise ConfigError("PyYAML is required to load config files") from exc
+        try:
+            from yaml import CSafeLoader as Loader
+        except ImportError:
+            from yaml import SafeLoader as Loader  # type: ignore[assignment]
+        try:
+            from yaml import CSafeDumper as Dumper
+        except ImportError:
+            from yaml import SafeDumper as Dumper  # type: ignore[assignment]
+        _YAML = (yaml, Loader, Dumper)
+    return _YAML
+
+
+def _load_yaml(path: Path) -> object:
+    yaml, loader, _ = _import_yaml()
     if not path.exists():
         raise ConfigError(f"Config file not found: {path}")
-    with path.open("r", encoding="utf-8") as handle:
-        return yaml.safe_load(handle)
+    return yaml.load(path.read_bytes(), Loader=loader)
 
 
 def _dump_yaml(path: Path, data: dict) -> None:
-    try:
-        import yaml
-    except ImportError as exc:
-        raise ConfigError("PyYAML is required to save config files") from exc
-    content = yaml.safe_dump(data, sort_keys=False)
+    yaml, _, dumper = _import_yaml()
     path.parent.mkdir(parents=True, exist_ok=True)
-    with path.open("w", encoding="utf-8") as handle:
-        handle.write(content)
+    with path.open("wb") as handle:
+        yaml.dump(data, stream=handle, Dumper=dumper, sort_keys=False, encoding="utf-8")
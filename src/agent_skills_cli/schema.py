@@ -1,29 +1,44 @@
 from __future__ import annotations
 
 import re
+import string
+import sys
 from collections.abc import Iterable
-from dataclasses import dataclass, field
-from pathlib import PurePath
+from dataclasses import dataclass, field, replace
 
 from .errors import ConfigError
 
-_SHA_RE = re.compile(r"^[0-9a-fA-F]{7,40}$")
-_AGENT_NAME_RE = re.compile(r"^[A-Za-z0-9_.-]+$")
+_SHA_MIN_LEN = 7
+_SHA_MAX_LEN = 40
+_HEX_CHARS = frozenset(string.hexdigits)
+_AGENT_NAME_CHARS = frozenset(string.ascii_letters + string.digits + "_.-")
+_ABS_PATH_RE = re.compile(r"^(?:[/\\]|[A-Za-z]:(?:[/\\]|$))")
+
+
+def _is_hex_sha(value: str) -> bool:
+    return _SHA_MIN_LEN <= len(value) <= _SHA_MAX_LEN and not (set(value) - _HEX_CHARS)
+
+
+def _is_agent_name(value: str) -> bool:
+    return bool(value) and not (set(value) - _AGENT_NAME_CHARS)
+
+
+_MISSING = object()
 
 
 def _require_str(data: dict, key: str) -> str:
-    if key not in data:
+    value = data.get(key, _MISSING)
+    if value is _MISSING:
         raise ConfigError(f"Missing required key: {key}")
-    value = data[key]
     if not isinstance(value, str) or not value.strip():
         raise ConfigError(f"Expected non-empty string for '{key}'")
     return value
 
 
 def _optional_str(data: dict, key: str, default: str | None = None) -> str | None:
-    if key not in data:
+    value = data.get(key, _MISSING)
+    if value is _MISSING:
         return default
-    value = data[key]
     if value is None:
         return None
     if not isinstance(value, str) or not value.strip():
@@ -32,9 +47,9 @@ def _optional_str(data: dict, key: str, default: str | None = None) -> str | Non
 
 
 def _optional_list(data: dict, key: str, default: list | None = None) -> list:
-    if key not in data:
+    value = data.get(key, _MISSING)
+    if value is _MISSING:
         return default if default is not None else []
-    value = data[key]
     if value is None:
         return []
     if not isinstance(value, list):
@@ -43,9 +58,9 @@ def _optional_list(data: dict, key: str, default: list | None = None) -> list:
 
 
 def _optional_dict(data: dict, key: str, default: dict | None = None) -> dict:
-    if key not in data:
+    value = data.get(key, _MISSING)
+    if value is _MISSING:
         return default if default is not None else {}
-    value = data[key]
     if value is None:
         return {}
     if not isinstance(value, dict):
@@ -54,9 +69,9 @@ def _optional_dict(data: dict, key: str, default: dict | None = None) -> dict:
 
 
 def _expect_int(data: dict, key: str) -> int:
-    if key not in data:
+    value = data.get(key, _MISSING)
+    if value is _MISSING:
         raise ConfigError(f"Missing required key: {key}")
-    value = data[key]
     if not isinstance(value, int):
         raise ConfigError(f"Expected integer for '{key}'")
     return value
@@ -65,28 +80,24 @@ def _expect_int(data: dict, key: str) -> int:
 def _validate_relpath(path: str, key: str) -> None:
     if not path.strip():
         raise ConfigError(f"Expected non-empty string for '{key}'")
-    if path.startswith(("/", "\\")):
-        raise ConfigError(f"Path must be relative for '{key}'")
-    candidate = PurePath(path)
-    if candidate.is_absolute():
+    if _ABS_PATH_RE.match(path):
         raise ConfigError(f"Path must be relative for '{key}'")
-    if candidate.parts:
-        first = candidate.parts[0]
-        if re.fullmatch(r"[A-Za-z]:", first):
-            raise ConfigError(f"Path must be relative for '{key}'")
-    if ".." in candidate.parts:
+    if any(part == ".." for part in path.replace("\\", "/").split("/")):
         raise ConfigError(f"Path cannot contain '..' for '{key}'")
 
 
 def _validate_unique(items: Iterable[str], label: str) -> None:
-    seen = set()
-    for item in items:
+    values = list(items)
+    if len(set(values)) == len(values):
+        return
+    seen: set[str] = set()
+    for item in values:
         if item in seen:
             raise ConfigError(f"Duplicate {label}: {item}")
         seen.add(item)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AgentConfig:
     target_dir: str | None = None
 
@@ -108,22 +119,42 @@ class AgentConfig:
         return data
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SkillConfig:
     name: str
     location: str = field(default=".")
-    agents: list[str] = field(default_factory=list)
+    agents: tuple[str, ...] = ()
 
     @classmethod
     def from_dict(cls, data: dict) -> SkillConfig:
+        # Specialized by hand: this is the innermost per-item constructor, so
+        # the generic field helpers are inlined to one dict probe per field.
         if not isinstance(data, dict):
             raise ConfigError("Skill config must be a mapping")
-        name = _require_str(data, "name")
-        location = _optional_str(data, "location") or "."
-        agents = _optional_list(data, "agents", [])
+        name = data.get("name", _MISSING)
+        if name is _MISSING:
+            raise ConfigError("Missing required key: name")
+        if not isinstance(name, str) or not name.strip():
+            raise ConfigError("Expected non-empty string for 'name'")
+        location = data.get("location")
+        if location is None:
+            location = "."
+        elif not isinstance(location, str) or not location.strip():
+            raise ConfigError("Expected non-empty string for 'location'")
+        agents = data.get("agents")
+        if agents is None:
+            agents = []
+        elif not isinstance(agents, list):
+            raise ConfigError("Expected list for 'agents'")
         if not all(isinstance(a, str) and a.strip() for a in agents):
             raise ConfigError("Skill agents must be non-empty strings")
-        return cls(name=name, location=location, agents=agents)
+        skill = cls(
+            name=sys.intern(name),
+            location=location,
+            agents=tuple(sys.intern(agent) for agent in agents),
+        )
+        skill.validate()
+        return skill
 
     def validate(self) -> None:
         _validate_relpath(self.location, "skills[].location")
@@ -139,7 +170,7 @@ class SkillConfig:
         return data
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RepoConfig:
     repo: str
     rev: str
@@ -156,10 +187,15 @@ class RepoConfig:
         skills = [
             SkillConfig.from_dict(raw) for raw in _optional_list(data, "skills", [])
         ]
+        if resolved_sha and not _is_hex_sha(resolved_sha):
+            raise ConfigError(
+                f"resolved_sha must be a 7-40 char hex string: {resolved_sha}"
+            )
+        _validate_unique((skill.name for skill in skills), "skill name")
         return cls(repo=repo, rev=rev, resolved_sha=resolved_sha, skills=skills)
 
     def validate(self) -> None:
-        if self.resolved_sha and not _SHA_RE.fullmatch(self.resolved_sha):
+        if self.resolved_sha and not _is_hex_sha(self.resolved_sha):
             raise ConfigError(
                 f"resolved_sha must be a 7-40 char hex string: {self.resolved_sha}"
             )
@@ -179,7 +215,7 @@ class RepoConfig:
         return data
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RootConfig:
     version: int
     store_dir: str = ".agent-skills/store"
@@ -199,15 +235,19 @@ class RootConfig:
         for name, cfg in raw_agents.items():
             if not isinstance(name, str) or not name.strip():
                 raise ConfigError("Agent names must be non-empty strings")
-            if not _AGENT_NAME_RE.fullmatch(name):
+            if not _is_agent_name(name):
                 raise ConfigError(f"Invalid agent name: {name}")
-            agents[name] = AgentConfig.from_dict(cfg)
+            agents[sys.intern(name)] = AgentConfig.from_dict(cfg)
 
         repos = [RepoConfig.from_dict(raw) for raw in _optional_list(data, "repos", [])]
 
-        config = cls(version=version, store_dir=store_dir, agents=agents, repos=repos)
-        config.validate()
-        return config
+        if version != 1:
+            raise ConfigError("Unsupported config version (expected 1)")
+        _validate_unique((repo.repo for repo in repos), "repo URL")
+        _validate_unique(
+            [skill.name for repo in repos for skill in repo.skills], "skill name"
+        )
+        return cls(version=version, store_dir=store_dir, agents=agents, repos=repos)
 
     def validate(self) -> None:
         if self.version != 1:
@@ -223,6 +263,41 @@ class RootConfig:
             skill_names.extend(skill.name for skill in repo.skills)
         _validate_unique(skill_names, "skill name")
 
+    def find_skill(self, name: str) -> SkillConfig | None:
+        for repo in self.repos:
+            for skill in repo.skills:
+                if skill.name == name:
+                    return skill
+        return None
+
+    def with_skill_enabled(self, skill_name: str, agents: Iterable[str]) -> RootConfig:
+        """Return a copy with the named skill enabled for the given agents.
+
+        Unrelated repos and skills are shared with the original config.
+        The copy skips a full from_dict round trip, so the incoming agent
+        names are validated here before they reach the saved config.
+        """
+        requested = list(agents)
+        if not all(isinstance(agent, str) and agent.strip() for agent in requested):
+            raise ConfigError("Skill agents must be non-empty strings")
+        new_repos: list[RepoConfig] = []
+        found = False
+        for repo in self.repos:
+            new_repos.append(repo)
+            for idx, skill in enumerate(repo.skills):
+                if skill.name != skill_name:
+                    continue
+                merged = list(skill.agents)
+                merged.extend(agent for agent in requested if agent not in merged)
+                new_skills = list(repo.skills)
+                new_skills[idx] = replace(skill, agents=tuple(merged))
+                new_repos[-1] = replace(repo, skills=new_skills)
+                found = True
+                break
+        if not found:
+            raise ConfigError(f"Skill not found: {skill_name}")
+        return replace(self, repos=new_repos)
+
     def to_dict(self) -> dict:
         data = {
             "version": self.version,
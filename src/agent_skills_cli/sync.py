@@ -1,19 +1,30 @@
 from __future__ import annotations
 
+import functools
+import hashlib
 import logging
+import os
 import re
 import shutil
+import stat
 import subprocess
-import tempfile
 from collections.abc import Callable, Iterable
-from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, replace
 from pathlib import Path, PurePosixPath
 
 from .config import load_config, save_config
 from .errors import ConfigError
-from .schema import AgentConfig, RootConfig
+from .schema import AgentConfig, RepoConfig
 
 _REPO_ID_RE = re.compile(r"[^A-Za-z0-9]+")
+_UNDERSCORE_RUN_RE = re.compile(r"_+")
+_REPO_ID_TABLE = str.maketrans(
+    {char: "_" for char in map(chr, range(128)) if not char.isalnum()}
+)
+_SHA_RE = re.compile(r"^[0-9a-f]{7,40}$")
+_FULL_SHA_LEN = 40
+_CACHE_DIR_NAME = ".cache.git"
 
 
 def sync_config(
@@ -31,8 +42,11 @@ def sync_repo(
 def _sync_config(
     config_path: Path, *, force: bool, repo_filter: set[str] | None, verbose: bool
 ) -> None:
+    # Worktree exports run git with -C <cache_dir>, which resolves relative
+    # paths against the cache rather than the process cwd, so pin the whole
+    # store layout to absolute paths up front.
+    config_path = config_path.resolve()
     config = load_config(config_path)
-    data = config.to_dict()
     project_root = config_path.parent
     store_dir = project_root / config.store_dir
     store_dir.mkdir(parents=True, exist_ok=True)
@@ -49,45 +63,44 @@ def _sync_config(
     processed_repos: dict[Path, str] = {}
 
     def _sync_body() -> None:
-        for repo_entry in data.get("repos", []):
-            if repo_filter is not None and repo_entry.get("repo") not in repo_filter:
-                continue
-            repo_url = repo_entry["repo"]
-            rev = repo_entry["rev"]
-            log(f"Repo: {repo_url} ({rev})")
-            sparse_paths = _collect_sparse_paths(repo_entry)
-            if not sparse_paths:
-                log("No skill paths configured, skipping.")
+        entries = [
+            repo_cfg
+            for repo_cfg in config.repos
+            if repo_filter is None or repo_cfg.repo in repo_filter
+        ]
+        for target_dir in _referenced_target_dirs(entries, config.agents):
+            (project_root / target_dir).mkdir(parents=True, exist_ok=True)
+
+        process = functools.partial(
+            _process_repo, store_dir=store_dir, created_dirs=created_dirs, log=log
+        )
+        if len(entries) > 1:
+            with ThreadPoolExecutor(max_workers=min(8, len(entries))) as pool:
+                results = list(pool.map(process, entries))
+        else:
+            results = [process(repo_cfg) for repo_cfg in entries]
+
+        resolved: dict[str, str] = {}
+        for repo_cfg, result in zip(entries, results, strict=True):
+            if result is None:
                 continue
-            log(f"Sparse paths: {', '.join(sparse_paths)}")
-            repo_id = _repo_id(repo_url)
-            repo_root = store_dir / repo_id
-            resolved_sha, created = _export_sparse_repo(
-                repo_url=repo_url,
-                rev=rev,
-                repo_root=repo_root,
-                sparse_paths=sparse_paths,
-                log=log,
-            )
-            repo_entry["resolved_sha"] = resolved_sha
+            repo_root, resolved_sha, _created = result
+            resolved[repo_cfg.repo] = resolved_sha
             log(f"Resolved SHA: {resolved_sha}")
-            if created:
-                created_dirs.append(repo_root / resolved_sha)
             processed_repos[repo_root] = resolved_sha
 
             worktree = repo_root / resolved_sha
-            for skill in repo_entry.get("skills", []):
-                skill_root = _normalize_skill_path(skill.get("location", ""))
-                skill_path = worktree / skill_root
-                log(f"Checking skill {skill['name']} at {skill_path}")
+            for skill in repo_cfg.skills:
+                skill_path = worktree / _normalize_skill_path(skill.location)
+                log(f"Checking skill {skill.name} at {skill_path}")
                 if not (skill_path / "SKILL.md").is_file():
                     raise ConfigError(
-                        f"Missing SKILL.md for {skill['name']} at {skill_path}"
+                        f"Missing SKILL.md for {skill.name} at {skill_path}"
                     )
                 _link_skill(
                     skill_path=skill_path,
-                    skill_name=skill["name"],
-                    agents=skill.get("agents", []),
+                    skill_name=skill.name,
+                    agents=skill.agents,
                     context=link_context,
                     log=log,
                 )
@@ -98,7 +111,13 @@ def _sync_config(
             repo_filter=repo_filter,
             log=log,
         )
-        save_config(config_path, RootConfig.from_dict(data))
+        updated_repos = [
+            replace(repo_cfg, resolved_sha=resolved[repo_cfg.repo])
+            if resolved.get(repo_cfg.repo) not in (None, repo_cfg.resolved_sha)
+            else repo_cfg
+            for repo_cfg in config.repos
+        ]
+        save_config(config_path, replace(config, repos=updated_repos))
         log("Sync complete.")
 
     try:
@@ -111,14 +130,84 @@ def _sync_config(
         raise
 
 
+def _process_repo(
+    repo_cfg: RepoConfig,
+    *,
+    store_dir: Path,
+    created_dirs: list[Path],
+    log: Callable[[str], None],
+) -> tuple[Path, str, bool] | None:
+    """Fetch/export one repo; safe to run from a worker thread."""
+    repo_id = _repo_id(repo_cfg.repo)
+    rlog = _prefixed(log, repo_id)
+    rlog(f"Repo: {repo_cfg.repo} ({repo_cfg.rev})")
+    sparse_paths = _collect_sparse_paths(repo_cfg)
+    if not sparse_paths:
+        rlog("No skill paths configured, skipping.")
+        return None
+    rlog(f"Sparse paths: {', '.join(sparse_paths)}")
+    repo_root = store_dir / repo_id
+    cached_sha = repo_cfg.resolved_sha
+    if (
+        cached_sha
+        and _SHA_RE.fullmatch(repo_cfg.rev)
+        and cached_sha.startswith(repo_cfg.rev)
+        and _export_satisfies(repo_root / cached_sha, repo_cfg)
+    ):
+        rlog(f"Reusing cached export for pinned rev: {cached_sha}")
+        resolved_sha, created = cached_sha, False
+    else:
+        resolved_sha, created = _export_sparse_repo(
+            repo_url=repo_cfg.repo,
+            rev=repo_cfg.rev,
+            repo_root=repo_root,
+            sparse_paths=sparse_paths,
+            log=rlog,
+        )
+    if created:
+        # Recorded from the worker so a failure elsewhere still cleans up.
+        created_dirs.append(repo_root / resolved_sha)
+    return repo_root, resolved_sha, created
+
+
 def _repo_id(repo_url: str) -> str:
-    return _REPO_ID_RE.sub("__", repo_url).strip("_")
+    # Sanitizing collapses every non-alnum run, so distinct URLs such as
+    # ".../repo.git" and ".../repo_git" map to the same name; a short URL
+    # digest keeps each repo (and its bare cache) in its own directory.
+    digest = hashlib.sha256(repo_url.encode()).hexdigest()[:8]
+    if repo_url.isascii():
+        translated = repo_url.translate(_REPO_ID_TABLE)
+        base = _UNDERSCORE_RUN_RE.sub("__", translated).strip("_")
+    else:
+        base = _REPO_ID_RE.sub("__", repo_url).strip("_")
+    return f"{base}-{digest}" if base else digest
+
+
+def _prefixed(log: Callable[[str], None], repo_id: str) -> Callable[[str], None]:
+    def _log(message: str) -> None:
+        log(f"[{repo_id}] {message}")
+
+    return _log
+
 
+def _referenced_target_dirs(
+    entries: list[RepoConfig], agent_targets: dict[str, AgentConfig]
+) -> list[str]:
+    """Collect target dirs of agents actually used by the synced skills."""
+    dirs: list[str] = []
+    for repo_cfg in entries:
+        for skill in repo_cfg.skills:
+            for agent in skill.agents:
+                target_cfg = agent_targets.get(agent)
+                if target_cfg and target_cfg.target_dir:
+                    dirs.append(target_cfg.target_dir)
+    return _dedupe(dirs)
 
-def _collect_sparse_paths(repo_entry: dict) -> list[str]:
+
+def _collect_sparse_paths(repo_cfg: RepoConfig) -> list[str]:
     patterns: list[str] = []
-    for skill in repo_entry.get("skills", []):
-        path = _normalize_skill_path(skill.get("location", ""))
+    for skill in repo_cfg.skills:
+        path = _normalize_skill_path(skill.location)
         if not path:
             continue
         prefix = path.rstrip("/")
@@ -133,8 +222,19 @@ def _collect_sparse_paths(repo_entry: dict) -> list[str]:
     return _dedupe(patterns)
 
 
-def _normalize_skill_path(value: object) -> str:
-    raw = str(value).strip()
+def _export_satisfies(worktree: Path, repo_cfg: RepoConfig) -> bool:
+    """Check whether an existing export already contains every skill."""
+    if not worktree.is_dir():
+        return False
+    return all(
+        (worktree / _normalize_skill_path(skill.location) / "SKILL.md").is_file()
+        for skill in repo_cfg.skills
+    )
+
+
+@functools.lru_cache(maxsize=512)
+def _normalize_skill_path(value: str) -> str:
+    raw = value.strip()
     if not raw:
         return ""
     cleaned = raw.rstrip("/")
@@ -153,62 +253,103 @@ def _export_sparse_repo(
     log: Callable[[str], None],
 ) -> tuple[str, bool]:
     repo_root.mkdir(parents=True, exist_ok=True)
-    with tempfile.TemporaryDirectory() as tmp:
-        tmp_path = Path(tmp)
-        log(f"Init temp repo: {tmp_path}")
-        log(f"Git sparse checkout setup: {', '.join(sparse_paths)}")
-        _run(["git", "init", str(tmp_path)])
-        _run(["git", "-C", str(tmp_path), "remote", "add", "origin", repo_url])
-        _run(["git", "-C", str(tmp_path), "sparse-checkout", "init", "--no-cone"])
+    cache_dir = _ensure_repo_cache(repo_url, repo_root, log)
+    log(f"Fetch depth=1 {rev}")
+    _run(
+        [
+            "git",
+            "-C",
+            str(cache_dir),
+            "fetch",
+            "--depth",
+            "1",
+            "--filter=blob:none",
+            "origin",
+            rev,
+        ]
+    )
+    if len(rev) == _FULL_SHA_LEN and _SHA_RE.fullmatch(rev):
+        # A full SHA pin is its own resolution; the fetch above already
+        # verified the remote has it.
+        resolved_sha = rev
+    else:
+        resolved_sha = str(
+            _run(
+                ["git", "-C", str(cache_dir), "rev-parse", "FETCH_HEAD"],
+                capture_output=True,
+            ).stdout.strip()
+        )
+
+    dest = repo_root / resolved_sha
+    if dest.exists():
+        log(f"Export exists: {dest}")
+        return resolved_sha, False
+
+    _add_sparse_worktree(
+        cache_dir=cache_dir,
+        dest=dest,
+        sha=resolved_sha,
+        sparse_paths=sparse_paths,
+        log=log,
+    )
+    return resolved_sha, True
+
+
+def _ensure_repo_cache(
+    repo_url: str, repo_root: Path, log: Callable[[str], None]
+) -> Path:
+    """Create (once) the persistent bare cache a repo's worktrees hang off."""
+    cache_dir = repo_root / _CACHE_DIR_NAME
+    if not cache_dir.is_dir():
+        log(f"Init repo cache: {cache_dir}")
+        _run(["git", "init", "--bare", str(cache_dir)])
+        _run(["git", "-C", str(cache_dir), "remote", "add", "origin", repo_url])
+    return cache_dir
+
+
+def _add_sparse_worktree(
+    *,
+    cache_dir: Path,
+    dest: Path,
+    sha: str,
+    sparse_paths: list[str],
+    log: Callable[[str], None],
+) -> None:
+    # Drop admin entries of worktrees that were rmtree'd (cleanup or a
+    # failed earlier run); a stale entry would block re-adding the path.
+    _run(["git", "-C", str(cache_dir), "worktree", "prune"])
+    log(f"Add sparse worktree: {dest}")
+    log(f"Git sparse checkout setup: {', '.join(sparse_paths)}")
+    try:
         _run(
             [
                 "git",
                 "-C",
-                str(tmp_path),
-                "sparse-checkout",
-                "set",
-                "--no-cone",
-                *sparse_paths,
+                str(cache_dir),
+                "worktree",
+                "add",
+                "--no-checkout",
+                str(dest),
+                sha,
             ]
         )
-        log(f"Fetch depth=1 {rev}")
         _run(
             [
                 "git",
                 "-C",
-                str(tmp_path),
-                "fetch",
-                "--depth",
-                "1",
-                "origin",
-                rev,
+                str(dest),
+                "sparse-checkout",
+                "set",
+                "--no-cone",
+                *sparse_paths,
             ]
         )
-        log("Checkout FETCH_HEAD")
-        _run(["git", "-C", str(tmp_path), "checkout", "FETCH_HEAD"])
-        resolved_sha = str(
-            _run(
-                ["git", "-C", str(tmp_path), "rev-parse", "HEAD"],
-                capture_output=True,
-            ).stdout.strip()
-        )
-
-        dest = repo_root / resolved_sha
+        _run(["git", "-C", str(dest), "checkout"])
+    except ConfigError:
         if dest.exists():
-            log(f"Export exists: {dest}")
-            return resolved_sha, False
-
-        temp_export = repo_root / f".tmp-{resolved_sha}"
-        if temp_export.exists():
-            shutil.rmtree(temp_export)
-        log(f"Export to {temp_export}")
-        try:
-            _copy_tree(tmp_path, temp_export)
-            temp_export.replace(dest)
-        finally:
-            if temp_export.exists():
-                shutil.rmtree(temp_export)
-        return resolved_sha, True
+            shutil.rmtree(dest)
+        _run(["git", "-C", str(cache_dir), "worktree", "prune"])
+        raise
 
 
 @dataclass(frozen=True)
@@ -226,46 +367,59 @@ def _link_skill(
     context: _LinkContext,
     log: Callable[[str], None],
 ) -> None:
+    resolved_target: Path | None = None
     for agent in agents:
         target_cfg = context.agent_targets.get(agent)
         if target_cfg and target_cfg.target_dir:
+            if resolved_target is None:
+                resolved_target = _resolve_link_target(skill_path)
+            # Target dirs are pre-created in one batch by _sync_config.
             target_dir = context.project_root / target_cfg.target_dir
-            target_dir.mkdir(parents=True, exist_ok=True)
-            _ensure_symlink(target_dir / skill_name, skill_path, force=context.force)
+            _ensure_symlink(
+                target_dir / skill_name, resolved_target, force=context.force
+            )
             log(f"Linked {skill_name} -> {target_dir / skill_name}")
         else:
             log(f"Skipped {skill_name} for {agent}: no target_dir configured")
 
 
-def _ensure_symlink(link_path: Path, target: Path, *, force: bool) -> None:
+def _resolve_link_target(target: Path) -> Path:
     if not target.exists():
         raise ConfigError(f"Symlink target does not exist: {target}")
     if not target.is_dir():
         raise ConfigError(f"Symlink target is not a directory: {target}")
-    resolved_target = target.resolve()
-    if link_path.is_symlink():
-        if link_path.resolve(strict=False) == resolved_target:
-            return
+    return target.resolve()
+
+
+def _ensure_symlink(link_path: Path, resolved_target: Path, *, force: bool) -> None:
+    # One lstat tells us everything about the existing path; the common
+    # case (link already correct) then costs lstat + readlink.
+    try:
+        mode = os.lstat(link_path).st_mode
+    except FileNotFoundError:
+        link_path.symlink_to(resolved_target, target_is_directory=True)
+        return
+    if stat.S_ISLNK(mode):
+        try:
+            if link_path.readlink() == resolved_target:
+                return
+        except OSError:
+            pass
         link_path.unlink()
-    elif link_path.exists():
+    elif stat.S_ISDIR(mode):
         if not force:
             raise ConfigError(f"Path exists and is not a symlink: {link_path}")
-        if link_path.is_dir():
-            if any(link_path.iterdir()):
+        with os.scandir(link_path) as entries:
+            if next(entries, None) is not None:
                 raise ConfigError(f"Refusing to overwrite non-empty dir: {link_path}")
-            link_path.rmdir()
-        else:
-            link_path.unlink()
+        link_path.rmdir()
+    else:
+        if not force:
+            raise ConfigError(f"Path exists and is not a symlink: {link_path}")
+        link_path.unlink()
     link_path.symlink_to(resolved_target, target_is_directory=True)
 
 
-def _copy_tree(src: Path, dest: Path) -> None:
-    def _ignore(_: str, entries: list[str]) -> set[str]:
-        return {".git"} if ".git" in entries else set()
-
-    shutil.copytree(src, dest, ignore=_ignore)
-
-
 def _cleanup_store(
     *,
     store_dir: Path,
@@ -279,44 +433,46 @@ def _cleanup_store(
     if repo_filter is not None:
         return
 
-    keep_roots = set(processed_repos.keys())
-    for entry in store_dir.iterdir():
-        if not entry.is_dir():
-            continue
-        if entry in keep_roots:
-            continue
-        log(f"Pruning store repo: {entry}")
-        shutil.rmtree(entry)
+    keep_names = {repo_root.name for repo_root in processed_repos}
+    with os.scandir(store_dir) as entries:
+        for entry in entries:
+            if not entry.is_dir(follow_symlinks=False):
+                continue
+            if entry.name in keep_names:
+                continue
+            log(f"Pruning store repo: {entry.path}")
+            shutil.rmtree(entry.path)
 
 
 def _cleanup_repo_root(
     *, repo_root: Path, keep: set[str], log: Callable[[str], None]
 ) -> None:
-    if not repo_root.exists():
+    try:
+        entries = os.scandir(repo_root)
+    except FileNotFoundError:
         return
-    for entry in repo_root.iterdir():
-        if not entry.is_dir():
-            continue
-        name = entry.name
-        if name in keep:
-            continue
-        if name.startswith(".tmp-"):
-            log(f"Removing temp export: {entry}")
-            shutil.rmtree(entry)
-            continue
-        log(f"Pruning store revision: {entry}")
-        shutil.rmtree(entry)
+    removed = False
+    with entries:
+        for entry in entries:
+            if not entry.is_dir(follow_symlinks=False):
+                continue
+            name = entry.name
+            if name in keep or name == _CACHE_DIR_NAME:
+                continue
+            if name.startswith(".tmp-"):
+                log(f"Removing temp export: {entry.path}")
+                shutil.rmtree(entry.path)
+                continue
+            log(f"Pruning store revision: {entry.path}")
+            shutil.rmtree(entry.path)
+            removed = True
+    cache_dir = repo_root / _CACHE_DIR_NAME
+    if removed and cache_dir.is_dir():
+        _run(["git", "-C", str(cache_dir), "worktree", "prune"])
 
 
 def _dedupe(items: list[str]) -> list[str]:
-    seen: set[str] = set()
-    output: list[str] = []
-    for item in items:
-        if item in seen:
-            continue
-        seen.add(item)
-        output.append(item)
-    return output
+    return list(dict.fromkeys(items))
 
 
 def _logger(*, enabled: bool) -> Callable[[str], None]:
@@ -332,15 +488,16 @@ def _logger(*, enabled: bool) -> Callable[[str], None]:
 def _run(
     cmd: list[str], *, capture_output: bool = False
 ) -> subprocess.CompletedProcess:
+    kwargs: dict = {"stdin": subprocess.DEVNULL}
+    if capture_output:
+        kwargs.update(capture_output=True, text=True)
     try:
-        return subprocess.run(  # noqa: S603
-            cmd,
-            check=True,
-            text=True,
-            capture_output=capture_output,
-        )
+        return subprocess.run(cmd, check=True, **kwargs)  # noqa: S603
     except FileNotFoundError as exc:
         raise ConfigError(f"Command not found: {cmd[0]}") from exc
     except subprocess.CalledProcessError as exc:
-        stderr = exc.stderr.strip() if exc.stderr else str(exc)
+        stderr = exc.stderr
+        if isinstance(stderr, bytes):
+            stderr = stderr.decode(errors="replace")
+        stderr = stderr.strip() if stderr else str(exc)
         raise ConfigError(f"Command failed: {' '.join(cmd)} ({stderr})") from exc
@@ -13,6 +13,15 @@ def test_init_creates_default(tmp_path):
     assert config.agents["codex"].target_dir == ".codex/skills"
 
 
+def test_load_config_reuses_parse_for_unchanged_file(tmp_path):
+    path = tmp_path / ".agent-skills.yaml"
+    init_config(path)
+    first = load_config(path)
+    assert load_config(path) is first
+    path.write_text("version: 1\nstore_dir: other/store\n", encoding="utf-8")
+    assert load_config(path).store_dir == "other/store"
+
+
 def test_init_requires_overwrite_flag(tmp_path):
     path = tmp_path / ".agent-skills.yaml"
     init_config(path)
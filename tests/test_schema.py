@@ -81,6 +81,53 @@ def test_resolved_sha_format():
         RootConfig.from_dict(config)
 
 
+def test_with_skill_enabled_shares_untouched_repos():
+    config = RootConfig.from_dict(
+        {
+            "version": 1,
+            "repos": [
+                {
+                    "repo": "https://example.com/repo1",
+                    "rev": "v1",
+                    "skills": [{"name": "skill-a", "location": "skill-a"}],
+                },
+                {
+                    "repo": "https://example.com/repo2",
+                    "rev": "v1",
+                    "skills": [{"name": "skill-b", "location": "skill-b"}],
+                },
+            ],
+        }
+    )
+    updated = config.with_skill_enabled("skill-a", ["codex", "codex"])
+    assert updated.find_skill("skill-a").agents == ("codex",)
+    assert updated.repos[1] is config.repos[1]
+    assert not config.find_skill("skill-a").agents
+
+
+def test_with_skill_enabled_rejects_blank_agent():
+    config = RootConfig.from_dict(
+        {
+            "version": 1,
+            "repos": [
+                {
+                    "repo": "https://example.com/repo",
+                    "rev": "v1",
+                    "skills": [{"name": "skill-a", "location": "skill-a"}],
+                }
+            ],
+        }
+    )
+    with pytest.raises(ConfigError):
+        config.with_skill_enabled("skill-a", ["  "])
+
+
+def test_with_skill_enabled_unknown_skill():
+    config = RootConfig.from_dict({"version": 1})
+    with pytest.raises(ConfigError):
+        config.with_skill_enabled("missing", ["codex"])
+
+
 def test_duplicate_skill_agents():
     config = {
         "version": 1,
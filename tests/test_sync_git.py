@@ -0,0 +1,248 @@
+import shutil
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from agent_skills_cli.config import load_config
+from agent_skills_cli.sync import sync_config
+
+
+def _git(*args, cwd=None):
+    subprocess.run(
+        ["git", "-c", "user.email=test@example.com", "-c", "user.name=test", *args],
+        cwd=cwd,
+        check=True,
+        capture_output=True,
+    )
+
+
+@pytest.fixture
+def skill_repo(tmp_path):
+    repo = tmp_path / "remote"
+    (repo / "skill-a").mkdir(parents=True)
+    (repo / "skill-a" / "SKILL.md").write_text("# skill-a\n", encoding="utf-8")
+    _git("init", "-b", "main", str(repo))
+    _git("add", "-A", cwd=repo)
+    _git("commit", "-m", "add skill-a", cwd=repo)
+    _git("tag", "v1", cwd=repo)
+    _git("config", "uploadpack.allowAnySHA1InWant", "true", cwd=repo)
+    return repo
+
+
+def _write_config(project, repo, rev):
+    config_path = project / ".agent-skills.yaml"
+    config_path.write_text(
+        f"""version: 1
+agents:
+  codex:
+    target_dir: .codex/skills
+repos:
+  - repo: {repo}
+    rev: {rev}
+    skills:
+      - name: skill-a
+        location: skill-a
+        agents: [codex]
+""",
+        encoding="utf-8",
+    )
+    return config_path
+
+
+def test_sync_exports_and_links_tag_rev(tmp_path, skill_repo):
+    project = tmp_path / "project"
+    project.mkdir()
+    config_path = _write_config(project, skill_repo, "v1")
+
+    sync_config(config_path)
+
+    link = project / ".codex" / "skills" / "skill-a"
+    assert link.is_symlink()
+    assert (link / "SKILL.md").is_file()
+    config = load_config(config_path)
+    assert config.repos[0].resolved_sha
+    assert len(config.repos[0].resolved_sha) == 40
+
+
+def test_sync_exports_sha_rev(tmp_path, skill_repo):
+    sha = subprocess.run(
+        ["git", "rev-parse", "HEAD"],
+        cwd=skill_repo,
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout.strip()
+    project = tmp_path / "project"
+    project.mkdir()
+    config_path = _write_config(project, skill_repo, sha)
+
+    sync_config(config_path)
+
+    config = load_config(config_path)
+    assert config.repos[0].resolved_sha == sha
+    store = project / ".agent-skills" / "store"
+    assert (next(store.iterdir()) / sha / "skill-a" / "SKILL.md").is_file()
+
+
+def test_sync_pinned_sha_reuses_cached_export(tmp_path, skill_repo):
+    sha = subprocess.run(
+        ["git", "rev-parse", "HEAD"],
+        cwd=skill_repo,
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout.strip()
+    project = tmp_path / "project"
+    project.mkdir()
+    config_path = _write_config(project, skill_repo, sha)
+
+    sync_config(config_path)
+    # A pinned rev with a cached export must not touch the network again.
+    shutil.rmtree(skill_repo)
+    sync_config(config_path)
+
+    assert load_config(config_path).repos[0].resolved_sha == sha
+
+
+def test_sync_with_relative_config_path(tmp_path, skill_repo, monkeypatch):
+    project = tmp_path / "project"
+    project.mkdir()
+    _write_config(project, skill_repo, "v1")
+    monkeypatch.chdir(project)
+
+    sync_config(Path(".agent-skills.yaml"))
+
+    link = project / ".codex" / "skills" / "skill-a"
+    assert link.is_symlink()
+    assert (link / "SKILL.md").is_file()
+
+
+def test_sync_multiple_repos(tmp_path, skill_repo):
+    other = tmp_path / "remote-b"
+    (other / "skill-b").mkdir(parents=True)
+    (other / "skill-b" / "SKILL.md").write_text("# skill-b\n", encoding="utf-8")
+    _git("init", "-b", "main", str(other))
+    _git("add", "-A", cwd=other)
+    _git("commit", "-m", "add skill-b", cwd=other)
+    _git("tag", "v1", cwd=other)
+
+    project = tmp_path / "project"
+    project.mkdir()
+    config_path = project / ".agent-skills.yaml"
+    config_path.write_text(
+        f"""version: 1
+agents:
+  codex:
+    target_dir: .codex/skills
+repos:
+  - repo: {skill_repo}
+    rev: v1
+    skills:
+      - name: skill-a
+        location: skill-a
+        agents: [codex]
+  - repo: {other}
+    rev: v1
+    skills:
+      - name: skill-b
+        location: skill-b
+        agents: [codex]
+""",
+        encoding="utf-8",
+    )
+
+    sync_config(config_path)
+
+    for name in ("skill-a", "skill-b"):
+        link = project / ".codex" / "skills" / name
+        assert link.is_symlink()
+        assert (link / "SKILL.md").is_file()
+
+
+def test_sync_colliding_repo_urls_use_separate_caches(tmp_path):
+    # "repo.git" and "repo_git" sanitize to the same store name; each repo
+    # must still keep its own cache and fetch from its own remote.
+    for name, skill in (("repo.git", "skill-a"), ("repo_git", "skill-b")):
+        remote = tmp_path / name
+        (remote / skill).mkdir(parents=True)
+        (remote / skill / "SKILL.md").write_text(f"# {skill}\n", encoding="utf-8")
+        _git("init", "-b", "main", str(remote))
+        _git("add", "-A", cwd=remote)
+        _git("commit", "-m", f"add {skill}", cwd=remote)
+        _git("tag", "v1", cwd=remote)
+
+    project = tmp_path / "project"
+    project.mkdir()
+    config_path = project / ".agent-skills.yaml"
+    config_path.write_text(
+        f"""version: 1
+agents:
+  codex:
+    target_dir: .codex/skills
+repos:
+  - repo: {tmp_path / "repo.git"}
+    rev: v1
+    skills:
+      - name: skill-a
+        location: skill-a
+        agents: [codex]
+  - repo: {tmp_path / "repo_git"}
+    rev: v1
+    skills:
+      - name: skill-b
+        location: skill-b
+        agents: [codex]
+""",
+        encoding="utf-8",
+    )
+
+    sync_config(config_path)
+
+    store = project / ".agent-skills" / "store"
+    assert len(list(store.iterdir())) == 2
+    for skill in ("skill-a", "skill-b"):
+        link = project / ".codex" / "skills" / skill
+        assert (link / "SKILL.md").read_text(encoding="utf-8") == f"# {skill}\n"
+
+
+def test_sync_rev_bump_reuses_repo_cache(tmp_path, skill_repo):
+    project = tmp_path / "project"
+    project.mkdir()
+    config_path = _write_config(project, skill_repo, "v1")
+    sync_config(config_path)
+    first = load_config(config_path).repos[0].resolved_sha
+
+    (skill_repo / "skill-a" / "SKILL.md").write_text("# skill-a v2\n", encoding="utf-8")
+    _git("add", "-A", cwd=skill_repo)
+    _git("commit", "-m", "update skill-a", cwd=skill_repo)
+    _git("tag", "v2", cwd=skill_repo)
+    config_path.write_text(
+        config_path.read_text(encoding="utf-8").replace("rev: v1", "rev: v2"),
+        encoding="utf-8",
+    )
+    sync_config(config_path)
+
+    second = load_config(config_path).repos[0].resolved_sha
+    assert second != first
+    repo_root = next((project / ".agent-skills" / "store").iterdir())
+    assert (repo_root / ".cache.git").is_dir()
+    assert (repo_root / second).is_dir()
+    assert not (repo_root / first).exists()
+    link = project / ".codex" / "skills" / "skill-a"
+    assert (link / "SKILL.md").read_text(encoding="utf-8") == "# skill-a v2\n"
+
+
+def test_sync_is_idempotent(tmp_path, skill_repo):
+    project = tmp_path / "project"
+    project.mkdir()
+    config_path = _write_config(project, skill_repo, "v1")
+
+    sync_config(config_path)
+    first = load_config(config_path).repos[0].resolved_sha
+    sync_config(config_path)
+
+    assert load_config(config_path).repos[0].resolved_sha == first
+    link = project / ".codex" / "skills" / "skill-a"
+    assert link.is_symlink()
+    assert (link / "SKILL.md").is_file()